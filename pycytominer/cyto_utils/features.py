@@ -59,15 +59,20 @@ def label_compartment(cp_features, compartment, metadata_cols):
         Recoded column names with appropriate metadata and compartment labels.
     """
 
-    compartment = compartment.Title()
-    avail_compartments = ["Cells", "Cytoplasm", "Nuceli", "Image", "Barcode"]
+    compartment = compartment.title()
+    avail_compartments = ["Cells", "Cytoplasm", "Nuclei", "Image", "Barcode"]
 
     assert (  # noqa: S101
         compartment in avail_compartments
     ), f"provide valid compartment. One of: {avail_compartments}"
 
+    # frozenset membership is O(1); formatters are built once outside the loop
+    metadata_cols = frozenset(metadata_cols)
+    metadata_format = "Metadata_{}".format
+    compartment_format = f"{compartment}_{{}}".format
+
     cp_features = [
-        f"Metadata_{x}" if x in metadata_cols else f"{compartment}_{x}"
+        metadata_format(x) if x in metadata_cols else compartment_format(x)
         for x in cp_features
     ]
 
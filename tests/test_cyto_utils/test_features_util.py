@@ -1,4 +1,9 @@
-from pycytominer.cyto_utils.features import convert_compartment_format_to_list
+import pytest
+
+from pycytominer.cyto_utils.features import (
+    convert_compartment_format_to_list,
+    label_compartment,
+)
 
 
 def test_convert_compartment_format_to_list():
@@ -12,3 +17,21 @@ def test_convert_compartment_format_to_list():
 
     compartments = convert_compartment_format_to_list("FoO")
     assert compartments == ["FoO"]
+
+
+def test_label_compartment():
+    features = label_compartment(
+        cp_features=["AreaShape_Area", "Plate", "Intensity_MeanIntensity_DNA"],
+        compartment="nuclei",
+        metadata_cols=["Plate"],
+    )
+    assert features == [
+        "Nuclei_AreaShape_Area",
+        "Metadata_Plate",
+        "Nuclei_Intensity_MeanIntensity_DNA",
+    ]
+
+    with pytest.raises(AssertionError, match="provide valid compartment"):
+        label_compartment(
+            cp_features=["AreaShape_Area"], compartment="MyoD", metadata_cols=[]
+        )